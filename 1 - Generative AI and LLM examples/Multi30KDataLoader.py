@@ -1,12 +1,23 @@
 # Multi30K Dataset DataLoader for German-English Translation
 
 # Import required libraries
+from collections import Counter
+import copy
+import functools
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import multiprocess
+import multiprocessing
+import os
+import sys
+from pathlib import Path
+import numpy as np
+import spacy
 import torch
 from torch.nn.utils.rnn import pad_sequence
-from torch.utils.data import DataLoader, Dataset
+from torch.utils.data import DataLoader, Dataset, Sampler
+import datasets
 from datasets import load_dataset
-from torchtext.data.utils import get_tokenizer
-from torchtext.vocab import build_vocab_from_iterator
 from typing import Iterable, List, Tuple
 import warnings
 warnings.filterwarnings('ignore')
@@ -24,42 +35,163 @@ print(f"Test samples: {len(dataset['test'])}")
 SRC_LANGUAGE = 'de'
 TGT_LANGUAGE = 'en'
 
+# spaCy model used to tokenize each language
+_SPACY_MODELS = {SRC_LANGUAGE: 'de_core_news_sm', TGT_LANGUAGE: 'en_core_web_sm'}
+
+# Trained components are disabled: only the rule-based tokenizer is needed
+_SPACY_DISABLE = ['tok2vec', 'tagger', 'morphologizer', 'parser', 'senter', 'attribute_ruler', 'lemmatizer', 'ner']
+
+# Load each spaCy model at most once per process
+@functools.lru_cache(maxsize=4)
+def _load_spacy(name: str):
+    """Return the tokenizer-only spaCy pipeline for model name"""
+    return spacy.load(name, disable=_SPACY_DISABLE)
+
+# Warm both models at import; on Linux, fork so worker processes (vocab building,
+# DataLoader workers) inherit the loaded models instead of loading them again
+for _name in _SPACY_MODELS.values():
+    _load_spacy(_name)
+if sys.platform.startswith('linux'):
+    multiprocessing.set_start_method('fork', force=True)
+
+# Tokenize many sentences in one batched pass
+def _spacy_tokenize_batch(texts: Iterable[str], lang: str) -> List[List[str]]:
+    """Return the token strings of every sentence in texts"""
+    return [[tok.text for tok in doc] for doc in _load_spacy(_SPACY_MODELS[lang]).pipe(texts, batch_size=256)]
+
+# Tokenize a single sentence (used for raw text at inference time)
+def _spacy_tokenize(text: str, lang: str) -> List[str]:
+    """Return the token strings of one sentence"""
+    return [tok.text for tok in _load_spacy(_SPACY_MODELS[lang])(text)]
+
 # Setup tokenizers for both languages
 token_transform = {}
-token_transform[SRC_LANGUAGE] = get_tokenizer('spacy', language='de_core_news_sm')
-token_transform[TGT_LANGUAGE] = get_tokenizer('spacy', language='en_core_web_sm')
+token_transform[SRC_LANGUAGE] = functools.partial(_spacy_tokenize, lang=SRC_LANGUAGE)
+token_transform[TGT_LANGUAGE] = functools.partial(_spacy_tokenize, lang=TGT_LANGUAGE)
 
 # Define special symbols and indices
 UNK_IDX, PAD_IDX, BOS_IDX, EOS_IDX = 0, 1, 2, 3
 special_symbols = ['<unk>', '<pad>', '<bos>', '<eos>']
 
-# Helper function to yield tokens from the dataset
-def yield_tokens(data_iter: List[dict], language: str) -> Iterable[List[str]]:
-    """Yield tokens for building vocabulary"""
-    for data_sample in data_iter:
-        yield token_transform[language](data_sample[language])
+# Vocabulary held in plain Python containers: lookups are dict/list indexing, with no C++ round-trip
+class FastVocab:
+    """
+    Token <-> index mapping with the subset of the torchtext Vocab API used here
+    (get_stoi, get_itos, lookup_indices, lookup_tokens, set_default_index, vocab[token], vocab(tokens)).
+    """
+    
+    __slots__ = ('itos', 'stoi', 'unk')
+    
+    def __init__(self, tokens: Iterable[str], specials: List[str], unk_idx: int = UNK_IDX):
+        """
+        Args:
+            tokens: Vocabulary tokens in index order (specials are skipped if repeated)
+            specials: Special symbols, placed first
+            unk_idx: Index returned for out-of-vocabulary tokens
+        """
+        self.itos = list(specials) + [t for t in tokens if t not in specials]
+        self.stoi = {t: i for i, t in enumerate(self.itos)}
+        self.unk = unk_idx
+    
+    def __len__(self):
+        return len(self.itos)
+    
+    def __contains__(self, token):
+        return token in self.stoi
+    
+    def __getitem__(self, token):
+        return self.stoi.get(token, self.unk)
+    
+    def __call__(self, tokens):
+        return self.lookup_indices(tokens)
+    
+    def lookup_indices(self, tokens: List[str]) -> List[int]:
+        get, unk = self.stoi.get, self.unk
+        return [get(t, unk) for t in tokens]
+    
+    def lookup_tokens(self, indices: List[int]) -> List[str]:
+        itos = self.itos
+        return [itos[i] for i in indices]
+    
+    def set_default_index(self, index: int):
+        self.unk = index
+    
+    def get_stoi(self):
+        return self.stoi
+    
+    def get_itos(self):
+        return self.itos
+
+# Bump when the on-disk layout of the cached artifacts changes
+_CACHE_FORMAT = 2
 
-# Build vocabularies for both languages
-vocab_transform = {}
+# Preprocessed artifacts (vocabularies + numericalized splits) are cached on disk,
+# keyed by everything that affects their contents
+_cache_key = hashlib.blake2b(
+    repr((_CACHE_FORMAT, datasets.__version__, _SPACY_MODELS[SRC_LANGUAGE], _SPACY_MODELS[TGT_LANGUAGE], special_symbols)).encode(),
+    digest_size=8
+).hexdigest()
+_cache_dir = Path("~/.cache/multi30k_de_en").expanduser() / _cache_key
+_vocab_cache_path = _cache_dir / "vocab.pt"
+
+# Write a cache file under a temporary name and rename it into place, so an interrupted
+# run never leaves a truncated file at the path that the exists() checks trust
+def _atomic_save(path: Path, save, obj):
+    """Call save(file, obj) on a temporary file, then atomically move it to path"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            save(f, obj)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
-for ln in [SRC_LANGUAGE, TGT_LANGUAGE]:
-    print(f"Building vocabulary for {ln}...")
+# Build the vocabulary for one language (in a worker process where fork is available)
+def _build_one(ln: str):
+    """Tokenize the train split and build the vocabulary for language ln"""
+    # The worker reopens the train split from the local Arrow cache (memory-mapped)
+    # instead of receiving the dataset through pickle
+    sentences = load_dataset("bentrevett/multi30k", split='train')[ln]
+    counter = Counter()
+    # Token counts do not depend on example order, so the split is read as stored
+    for tokens in _spacy_tokenize_batch(sentences, ln):
+        counter.update(tokens)
     
-    # Convert dataset to list and sort by source sentence length
-    train_data = list(dataset['train'])
-    sorted_data = sorted(train_data, key=lambda x: len(x[SRC_LANGUAGE].split()))
+    # Same ordering as torchtext's build_vocab_from_iterator: most frequent first, ties alphabetical
+    tokens = sorted(counter, key=lambda t: (-counter[t], t))
     
-    # Build vocabulary
-    vocab_transform[ln] = build_vocab_from_iterator(
-        yield_tokens(sorted_data, ln),
-        min_freq=1,
-        specials=special_symbols,
-        special_first=True
-    )
+    # Unknown tokens map to UNK_IDX
+    return FastVocab(tokens, special_symbols, unk_idx=UNK_IDX)
+
+# Build vocabularies for both languages (or load them from the cache)
+vocab_transform = {}
+
+if _vocab_cache_path.exists():
+    print(f"Loading cached vocabularies from {_cache_dir}...")
+    # Only token lists are stored, so loading never depends on how this module was imported
+    cached_itos = torch.load(_vocab_cache_path, weights_only=True)
+    for ln in [SRC_LANGUAGE, TGT_LANGUAGE]:
+        vocab_transform[ln] = FastVocab(cached_itos[ln], special_symbols, unk_idx=UNK_IDX)
+        print(f"  Vocabulary size for {ln}: {len(vocab_transform[ln])}")
+else:
+    # Tokenization is CPU-bound, so the two languages are built concurrently in separate processes.
+    # Only forked workers are safe here: this runs at import time, and a spawned worker would
+    # re-import this module (dataset, spaCy, and another pool) before it could run _build_one
+    print(f"Building vocabularies for {SRC_LANGUAGE} and {TGT_LANGUAGE}...")
+    if 'fork' in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('fork')) as executor:
+            futures = {ln: executor.submit(_build_one, ln) for ln in [SRC_LANGUAGE, TGT_LANGUAGE]}
+            for ln, future in futures.items():
+                vocab_transform[ln] = future.result()
+                print(f"  Vocabulary size for {ln}: {len(vocab_transform[ln])}")
+    else:
+        for ln in [SRC_LANGUAGE, TGT_LANGUAGE]:
+            vocab_transform[ln] = _build_one(ln)
+            print(f"  Vocabulary size for {ln}: {len(vocab_transform[ln])}")
     
-    # Set default index for unknown tokens
-    vocab_transform[ln].set_default_index(UNK_IDX)
-    print(f"  Vocabulary size for {ln}: {len(vocab_transform[ln])}")
+    _atomic_save(_vocab_cache_path, lambda f, obj: torch.save(obj, f),
+                 {ln: vocab.itos for ln, vocab in vocab_transform.items()})
 
 # Setup device
 device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
@@ -67,20 +199,21 @@ device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
 # Tensor transform for source (with flip option)
 def tensor_transform_s(token_ids: List[int]):
     """Add BOS/EOS tokens and flip source sequence"""
-    return torch.cat((
-        torch.tensor([BOS_IDX]),
-        torch.flip(torch.tensor(token_ids), dims=(0,)),
-        torch.tensor([EOS_IDX])
-    ))
+    # One preallocated buffer filled in place (reversed copy in one pass), then wrapped without copying
+    out = np.empty(len(token_ids) + 2, dtype=np.int64)
+    out[0] = BOS_IDX
+    out[-1] = EOS_IDX
+    out[1:-1] = np.asarray(token_ids, dtype=np.int64)[::-1]
+    return torch.from_numpy(out)
 
 # Tensor transform for target (no flip)
 def tensor_transform_t(token_ids: List[int]):
     """Add BOS/EOS tokens to target sequence"""
-    return torch.cat((
-        torch.tensor([BOS_IDX]),
-        torch.tensor(token_ids),
-        torch.tensor([EOS_IDX])
-    ))
+    out = np.empty(len(token_ids) + 2, dtype=np.int64)
+    out[0] = BOS_IDX
+    out[-1] = EOS_IDX
+    out[1:-1] = token_ids
+    return torch.from_numpy(out)
 
 # Helper function to chain transforms
 def sequential_transforms(*transforms):
@@ -91,11 +224,48 @@ def sequential_transforms(*transforms):
         return txt_input
     return func
 
+# Tokenize and numericalize a split once, instead of per sample per batch every epoch
+def _encode_batch(batch, src_lang, tgt_lang):
+    """Datasets.map function: id lists (with BOS/EOS) for source, flipped source, and target of a batch"""
+    src_ids, src_ids_flipped, tgt_ids = [], [], []
+    src_tokens = _spacy_tokenize_batch((text.rstrip("\n") for text in batch[src_lang]), src_lang)
+    tgt_tokens = _spacy_tokenize_batch((text.rstrip("\n") for text in batch[tgt_lang]), tgt_lang)
+    for src_toks, tgt_toks in zip(src_tokens, tgt_tokens):
+        src = vocab_transform[src_lang].lookup_indices(src_toks)
+        tgt = vocab_transform[tgt_lang].lookup_indices(tgt_toks)
+        src_ids.append([BOS_IDX] + src + [EOS_IDX])
+        src_ids_flipped.append([BOS_IDX] + src[::-1] + [EOS_IDX])
+        tgt_ids.append([BOS_IDX] + tgt + [EOS_IDX])
+    return {'src_ids': src_ids, 'src_ids_flipped': src_ids_flipped, 'tgt_ids': tgt_ids}
+
+# datasets.map starts its workers through the multiprocess package. Spawned workers would
+# re-import this module (rebuilding the datasets and nesting more map pools), so the
+# encoding pass only goes multi-process when those workers are forked
+_MAP_NUM_PROC = max(1, (os.cpu_count() or 2) // 2) if multiprocess.get_start_method() == 'fork' else None
+
+# Column types of the encoded split, so ids are stored in Arrow as int32 rather than inferred int64
+_ENCODED_FEATURES = datasets.Features({
+    name: datasets.Sequence(datasets.Value('int32')) for name in ('src_ids', 'src_ids_flipped', 'tgt_ids')
+})
+
+# Unpack an Arrow list column into one flat buffer + offsets (CSR layout), so a split
+# is a handful of .npy files that can be memory-mapped instead of per-sample pickles
+def _to_csr(column):
+    """Return (concatenated int32 ids, int64 offsets) for an Arrow list<int32> column"""
+    lists = column.combine_chunks()
+    offsets = lists.offsets.to_numpy().astype(np.int64)
+    # A sliced list array shares its parent's values buffer, so rebase on the first offset
+    flat = lists.values.to_numpy()[offsets[0]:offsets[-1]]
+    return flat, offsets - offsets[0]
+
 # PyTorch Dataset wrapper for Multi30K
 class Multi30KDataset(Dataset):
     """PyTorch Dataset wrapper for Multi30K from Hugging Face"""
     
-    def __init__(self, hf_dataset, src_lang='de', tgt_lang='en'):
+    _ARRAYS = ('src', 'src_flipped', 'src_offsets', 'tgt', 'tgt_offsets')
+    
+    def __init__(self, hf_dataset, src_lang='de', tgt_lang='en', cache_dir=None, flip=False,
+                 num_proc=_MAP_NUM_PROC):
         """
         Initialize the dataset wrapper
         
@@ -103,117 +273,277 @@ class Multi30KDataset(Dataset):
             hf_dataset: Hugging Face dataset split
             src_lang: Source language code
             tgt_lang: Target language code
+            cache_dir: Directory holding this split's memory-mapped id arrays (written on first use)
+            flip: Whether to serve the flipped source sequences
+            num_proc: Processes used by datasets.map to encode the split on a cache miss (None: in-process)
         """
-        self.data = list(hf_dataset)
         self.src_lang = src_lang
         self.tgt_lang = tgt_lang
         
-        # Sort by source sentence length for efficiency
-        self.data = sorted(self.data, key=lambda x: len(x[src_lang].split()))
+        if cache_dir is not None and all((cache_dir / f"{name}.npy").exists() for name in self._ARRAYS):
+            # Copy-on-write mapping: pages load lazily and tensors can wrap them without copying
+            arrays = {name: np.load(cache_dir / f"{name}.npy", mmap_mode='c') for name in self._ARRAYS}
+        else:
+            # Sort by source sentence length for efficiency; only an index array is sorted, and
+            # select() applies it as an Arrow indices mapping instead of copying rows into a list
+            src_lens = np.fromiter((len(x.split()) for x in hf_dataset[src_lang]), dtype=np.int32)
+            order = np.argsort(src_lens, kind='stable')
+            
+            # Pre-tokenized ids; both source variants are kept so flip only selects one.
+            # datasets.map encodes batches across processes and writes the results to Arrow
+            # (checkpointed in the HF cache) rather than building per-example Python objects
+            encoded = hf_dataset.select(order).map(
+                _encode_batch,
+                batched=True,
+                batch_size=1024,
+                num_proc=num_proc if num_proc and num_proc > 1 else None,
+                fn_kwargs={'src_lang': src_lang, 'tgt_lang': tgt_lang},
+                remove_columns=hf_dataset.column_names,
+                features=_ENCODED_FEATURES
+            ).data
+            arrays = {}
+            arrays['src'], arrays['src_offsets'] = _to_csr(encoded.column('src_ids'))
+            arrays['src_flipped'], _ = _to_csr(encoded.column('src_ids_flipped'))
+            arrays['tgt'], arrays['tgt_offsets'] = _to_csr(encoded.column('tgt_ids'))
+            
+            if cache_dir is not None:
+                for name in self._ARRAYS:
+                    _atomic_save(cache_dir / f"{name}.npy", np.save, arrays[name])
+        
+        self._src = {False: arrays['src'], True: arrays['src_flipped']}
+        self.src_offsets = arrays['src_offsets']
+        self.tgt = arrays['tgt']
+        self.tgt_offsets = arrays['tgt_offsets']
+        self.flip = flip
+        
+        # Sequence lengths in tokens (including BOS/EOS), used for length-bucketed batching
+        self.src_lens = np.diff(self.src_offsets)
+        self.tgt_lens = np.diff(self.tgt_offsets)
+    
+    def with_flip(self, flip):
+        """Return a copy of this dataset serving flipped or plain source ids (id arrays are shared)"""
+        view = copy.copy(self)
+        view.flip = flip
+        return view
     
     def __len__(self):
-        return len(self.data)
+        return len(self.src_offsets) - 1
     
     def __getitem__(self, idx):
-        example = self.data[idx]
-        return example[self.src_lang], example[self.tgt_lang]
+        # Zero-copy views over the flat id buffers
+        src = self._src[self.flip][self.src_offsets[idx]:self.src_offsets[idx + 1]]
+        tgt = self.tgt[self.tgt_offsets[idx]:self.tgt_offsets[idx + 1]]
+        return torch.from_numpy(src), torch.from_numpy(tgt)
+
+# Batch sampler that groups similar-length examples so batches carry little padding
+class BucketedBatchSampler(Sampler):
+    """
+    Shuffles examples each epoch, sorts them by length within buckets of bucket_size,
+    then greedily packs variable-size batches whose padded size (longest sequence x batch
+    size) stays within token_budget.
+    """
+    
+    def __init__(self, data_source, token_budget=4096, bucket_size=1024, seed=0):
+        """
+        Args:
+            data_source: Multi30KDataset providing src_lens/tgt_lens
+            token_budget: Max padded tokens (max_len * batch_size) per batch
+            bucket_size: Number of shuffled examples sorted together
+            seed: Base seed; the epoch number is added so each epoch reshuffles
+        """
+        # Both sides get padded, so the longer of the two decides the cost
+        self.lengths = np.maximum(data_source.src_lens, data_source.tgt_lens)
+        self.token_budget = token_budget
+        self.bucket_size = bucket_size
+        self.seed = seed
+        self.epoch = 0
+        # (epoch, batches) of the last plan built, shared by __len__ and __iter__
+        self._plan = None
+    
+    def _batches(self, epoch):
+        if self._plan is not None and self._plan[0] == epoch:
+            return self._plan[1]
+        rng = np.random.default_rng(self.seed + epoch)
+        order = rng.permutation(len(self.lengths))
+        batches = []
+        for start in range(0, len(order), self.bucket_size):
+            bucket = order[start:start + self.bucket_size]
+            bucket = bucket[np.argsort(self.lengths[bucket], kind='stable')]
+            batch, max_len = [], 0
+            for idx in bucket:
+                length = self.lengths[idx]
+                if batch and max(max_len, length) * (len(batch) + 1) > self.token_budget:
+                    batches.append(batch)
+                    batch, max_len = [], 0
+                batch.append(int(idx))
+                max_len = max(max_len, length)
+            if batch:
+                batches.append(batch)
+        # Shuffle batch order so training doesn't always go short-to-long within a bucket
+        rng.shuffle(batches)
+        self._plan = (epoch, batches)
+        return batches
+    
+    def __iter__(self):
+        batches = self._batches(self.epoch)
+        self.epoch += 1
+        return iter(batches)
+    
+    def __len__(self):
+        return len(self._batches(self.epoch))
 
 # Create dataset instances
-train_dataset = Multi30KDataset(dataset['train'], SRC_LANGUAGE, TGT_LANGUAGE)
-valid_dataset = Multi30KDataset(dataset['validation'], SRC_LANGUAGE, TGT_LANGUAGE)
-test_dataset = Multi30KDataset(dataset['test'], SRC_LANGUAGE, TGT_LANGUAGE)
+train_dataset = Multi30KDataset(dataset['train'], SRC_LANGUAGE, TGT_LANGUAGE, _cache_dir / 'train')
+valid_dataset = Multi30KDataset(dataset['validation'], SRC_LANGUAGE, TGT_LANGUAGE, _cache_dir / 'validation')
+test_dataset = Multi30KDataset(dataset['test'], SRC_LANGUAGE, TGT_LANGUAGE, _cache_dir / 'test')
 
-# Initialize text transforms (will be updated in get_translation_dataloaders)
+# Text transforms of the most recent get_translation_dataloaders call, for callers that
+# encode raw sentences (e.g. inference); the datasets themselves serve pre-encoded ids
 text_transform = {}
 
 # Collate function to process batches
-def collate_fn(batch):
-    """Collate function to process batches"""
-    src_batch, tgt_batch = [], []
-    
-    for src_sample, tgt_sample in batch:
-        # Process source sequences
-        src_sequences = text_transform[SRC_LANGUAGE](src_sample.rstrip("\n"))
-        src_sequences = torch.tensor(src_sequences, dtype=torch.int64)
-        
-        # Process target sequences
-        tgt_sequences = text_transform[TGT_LANGUAGE](tgt_sample.rstrip("\n"))
-        tgt_sequences = torch.tensor(tgt_sequences, dtype=torch.int64)
-        
-        src_batch.append(src_sequences)
-        tgt_batch.append(tgt_sequences)
+def collate_fn(batch, batch_first=False):
+    """
+    Collate function to pad and stack pre-tokenized batches
     
-    # Pad sequences
-    src_batch = pad_sequence(src_batch, padding_value=PAD_IDX, batch_first=True)
-    tgt_batch = pad_sequence(tgt_batch, padding_value=PAD_IDX, batch_first=True)
+    pad_sequence writes the requested layout directly, (batch_size, seq_len) or
+    (seq_len, batch_size), so no transpose (and no later contiguous copy) is needed.
+    """
+    src_batch, tgt_batch = zip(*batch)
     
-    # Transpose to get (seq_len, batch_size)
-    src_batch = src_batch.t()
-    tgt_batch = tgt_batch.t()
+    # Pad sequences (ids are stored as int32; models expect int64)
+    src_batch = pad_sequence(list(src_batch), padding_value=PAD_IDX, batch_first=batch_first).long()
+    tgt_batch = pad_sequence(list(tgt_batch), padding_value=PAD_IDX, batch_first=batch_first).long()
+    assert src_batch.is_contiguous() and tgt_batch.is_contiguous()
     
-    return src_batch.to(device), tgt_batch.to(device)
+    # Stays on the host: the DataLoader pins it, and the training loop moves it to the device
+    return src_batch, tgt_batch
+
+# Wrap a DataLoader so the host-to-device copy of the next batch overlaps the current step
+class CUDAPrefetcher:
+    """
+    Iterates a DataLoader of pinned (src, tgt) batches, issuing the copy of batch N+1 to the
+    device on a side CUDA stream while the caller works on batch N.
+    """
+    
+    def __init__(self, loader, device):
+        """
+        Args:
+            loader: DataLoader yielding tuples of pinned CPU tensors
+            device: CUDA device the batches are copied to
+        """
+        self.loader = loader
+        self.device = device
+        self.stream = torch.cuda.Stream(device=device)
+    
+    def _load(self, it):
+        """Start copying the next batch on the side stream, or return None when exhausted"""
+        try:
+            batch = next(it)
+        except StopIteration:
+            return None
+        with torch.cuda.stream(self.stream):
+            return tuple(t.to(self.device, non_blocking=True) for t in batch)
+    
+    def __iter__(self):
+        it = iter(self.loader)
+        nxt = self._load(it)
+        while nxt is not None:
+            # The compute stream must not read the batch before its copy finishes, and the
+            # allocator must not recycle its memory while the compute stream still uses it
+            current = torch.cuda.current_stream(self.device)
+            current.wait_stream(self.stream)
+            for t in nxt:
+                t.record_stream(current)
+            cur = nxt
+            nxt = self._load(it)
+            yield cur
+    
+    def __len__(self):
+        return len(self.loader)
+
+# DataLoader workers only by default when they are forked: after %run this module's classes
+# live in __main__, which spawned workers (the macOS/Windows default) cannot unpickle
+_LOADER_NUM_WORKERS = (os.cpu_count() or 2) // 2 if multiprocessing.get_start_method() == 'fork' else 0
 
 # Main function to create dataloaders
-def get_translation_dataloaders(batch_size=4, flip=False):
+def get_translation_dataloaders(batch_size=4, flip=False, num_workers=_LOADER_NUM_WORKERS, token_budget=4096,
+                                batch_first=False):
     """
     Create DataLoaders for translation task
     
+    With CUDA available, the training loader is wrapped in a CUDAPrefetcher and yields
+    batches already on the device (copied one batch ahead). Otherwise, and for validation,
+    batches are returned on the CPU (pinned when CUDA is available); move them in the
+    training loop with src.to(device, non_blocking=True) so the copy overlaps compute.
+    
     Args:
-        batch_size: Batch size for DataLoaders
+        batch_size: Batch size for the validation DataLoader
         flip: Whether to flip the source sequences
+        num_workers: Worker processes per DataLoader (0 loads batches in the main process);
+            the default is 0 unless the multiprocessing start method is fork
+        token_budget: Max padded tokens per training batch (training batches vary in size)
+        batch_first: Emit (batch_size, seq_len) batches, the layout PyTorch 2 SDPA kernels prefer;
+            the default (seq_len, batch_size) matches the seq-first RNN models in this repo.
+            Downstream models must consume the chosen layout.
     
     Returns:
         train_dataloader, valid_dataloader
     """
     global text_transform
     
-    # Update text_transform based on flip parameter
-    if flip:
-        text_transform[SRC_LANGUAGE] = sequential_transforms(
-            token_transform[SRC_LANGUAGE],
-            vocab_transform[SRC_LANGUAGE],
-            tensor_transform_s
-        )
-    else:
-        text_transform[SRC_LANGUAGE] = sequential_transforms(
-            token_transform[SRC_LANGUAGE],
-            vocab_transform[SRC_LANGUAGE],
-            tensor_transform_t
-        )
-    
-    text_transform[TGT_LANGUAGE] = sequential_transforms(
+    # Transforms for raw sentences, matching the ids this call's loaders serve
+    transform_src = sequential_transforms(
+        token_transform[SRC_LANGUAGE],
+        vocab_transform[SRC_LANGUAGE],
+        tensor_transform_s if flip else tensor_transform_t
+    )
+    transform_tgt = sequential_transforms(
         token_transform[TGT_LANGUAGE],
         vocab_transform[TGT_LANGUAGE],
         tensor_transform_t
     )
     
-    # Create DataLoaders
+    # Rebind rather than mutate, so loaders from earlier calls keep their own transforms
+    text_transform = {SRC_LANGUAGE: transform_src, TGT_LANGUAGE: transform_tgt}
+    
+    collate = functools.partial(collate_fn, batch_first=batch_first)
+    
+    # Create DataLoaders; datasets are already numericalized, flip just selects the cached source variant
     train_dataloader = DataLoader(
-        train_dataset,
-        batch_size=batch_size,
-        collate_fn=collate_fn,
-        drop_last=True,
-        shuffle=False  # Already sorted by length
+        train_dataset.with_flip(flip),
+        batch_sampler=BucketedBatchSampler(train_dataset, token_budget=token_budget),
+        collate_fn=collate,
+        pin_memory=torch.cuda.is_available(),
+        num_workers=num_workers,
+        persistent_workers=num_workers > 0
     )
     
     valid_dataloader = DataLoader(
-        valid_dataset,
+        valid_dataset.with_flip(flip),
         batch_size=batch_size,
-        collate_fn=collate_fn,
+        collate_fn=collate,
         drop_last=True,
-        shuffle=False
+        shuffle=False,
+        pin_memory=torch.cuda.is_available(),
+        num_workers=num_workers,
+        persistent_workers=num_workers > 0
     )
     
+    if torch.cuda.is_available():
+        train_dataloader = CUDAPrefetcher(train_dataloader, device)
+    
     return train_dataloader, valid_dataloader
 
 # Helper functions for decoding
 def index_to_eng(seq_en):
     """Convert English token indices back to text"""
-    return " ".join([vocab_transform['en'].get_itos()[index.item()] for index in seq_en])
+    # One lookup for the whole sequence instead of one call per token
+    return " ".join(vocab_transform['en'].lookup_tokens(seq_en.tolist()))
 
 def index_to_german(seq_de):
     """Convert German token indices back to text"""
-    return " ".join([vocab_transform['de'].get_itos()[index.item()] for index in seq_de])
+    return " ".join(vocab_transform['de'].lookup_tokens(seq_de.tolist()))
 
 # Test the dataloader
 if __name__ == "__main__":
@@ -233,10 +563,10 @@ if __name__ == "__main__":
     src_seq = src_batch[:, 0]
     tgt_seq = tgt_batch[:, 0]
     
-    # Remove padding
-    src_seq = src_seq[src_seq != PAD_IDX]
-    tgt_seq = tgt_seq[tgt_seq != PAD_IDX]
+    # Remove padding, then copy each sequence to Python once (a single sync if the batch is on the GPU)
+    src_ids = src_seq[src_seq != PAD_IDX].tolist()
+    tgt_ids = tgt_seq[tgt_seq != PAD_IDX].tolist()
     
     print(f"\nSample translation pair:")
-    print(f"  German: {index_to_german(src_seq)}")
-    print(f"  English: {index_to_eng(tgt_seq)}")
+    print(f"  German: {' '.join(vocab_transform[SRC_LANGUAGE].lookup_tokens(src_ids))}")
+    print(f"  English: {' '.join(vocab_transform[TGT_LANGUAGE].lookup_tokens(tgt_ids))}")
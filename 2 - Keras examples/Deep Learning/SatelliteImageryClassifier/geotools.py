@@ -12,8 +12,10 @@ from typing import List, Union, Optional, Iterable, Generator
 from tqdm.auto import tqdm
 import asyncio
 
-# Exact constants from skillsnetwork
-DEFAULT_CHUNK_SIZE = 8 << 10  # 8192 bytes
+# Constants from skillsnetwork; chunk size raised so large downloads make far fewer Python round-trips
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB
+DEFAULT_CONNECTIONS = 8  # Parallel range requests per download
+DEFAULT_READ_TIMEOUT = 60  # Seconds a range connection may stall before the download fails
 
 class InvalidURLException(Exception):
     """
@@ -80,54 +82,188 @@ def _is_file_to_symlink(path: Path) -> bool:
     # Don't symlink "._" junk
     return not (path.name.startswith("._") or path.name in ["__MACOSX"])
 
-async def _get_chunks(url: str, chunk_size: int) -> Generator[bytes, None, None]:
+async def _get_chunks_js(url: str, chunk_size: int) -> Generator[bytes, None, None]:
     """
-    Generator that yields consecutive chunks of bytes from URL 'url'
+    Generator that yields consecutive chunks of bytes from URL 'url' using the browser's fetch (JupyterLite).
     :param url: The URL containing the data file to be read
     :param chunk_size: The size of each chunk (in no. of bytes).
     :returns: Generator yielding chunks of bytes from file at URL until done.
-    :raise InvalidURLException: When URL is invalid.
     :raise Exception: When Exception encountered when reading from URL.
     """
-    if not _is_url_valid(url):
-        raise InvalidURLException(url)
+    from pyodide.http import pyfetch  # pyright: ignore
+    from pyodide.ffi import JsException  # pyright: ignore
     
     desc = f"Downloading {Path(urlparse(url).path).name}"
     
-    if _is_jupyterlite():
-        # JupyterLite environment (browser-based)
-        from js import fetch  # pyright: ignore
-        from pyodide.ffi import JsException  # pyright: ignore
+    try:
+        response = await pyfetch(url)
+        if not response.ok:
+            raise Exception(
+                f"received status code {response.status} from '{url}'."
+            )
+        reader = response.js_response.body.getReader()
         
         try:
-            response = await fetch(url)
-            reader = response.body.getReader()
+            pbar = tqdm(
+                mininterval=1,
+                desc=desc,
+                total=int(response.headers.get("content-length", 0)),
+            )
+        except ImportError:
+            pbar = None
+            print(f"{desc}...")
+        
+        while True:
+            # Read fields off the JS result directly: converting the whole result with to_py()
+            # and then calling tobytes() copied every chunk twice; to_bytes() copies it once
+            res = await reader.read()
+            if res.done:
+                break
+            value = res.value.to_bytes()
+            yield value
+            if pbar:
+                pbar.update(len(value))
+        
+        if pbar:
+            pbar.close()
             
-            try:
-                pbar = tqdm(
-                    mininterval=1,
-                    desc=desc,
-                    total=int(response.headers.get("content-length", 0)),
+    except (JsException, OSError):
+        raise Exception(f"Failed to read dataset at '{url}'.") from None
+
+def _download_requests(url: str, path: Path, chunk_size: int) -> None:
+    """
+    Streams the file at URL 'url' to 'path' with requests, copying in chunk_size blocks in C.
+    :param url: The URL containing the data file to be read
+    :param path: Destination file path.
+    :param chunk_size: The size of each copied block (in no. of bytes).
+    :raise Exception: When Exception encountered when reading from URL.
+    """
+    import requests
+    from requests.exceptions import ConnectionError
+    
+    desc = f"Downloading {Path(urlparse(url).path).name}"
+    
+    try:
+        with requests.get(url, stream=True) as response:
+            # If requests.get fails, it will return readable error
+            if response.status_code >= 400:
+                raise Exception(
+                    f"received status code {response.status_code} from '{url}'."
                 )
-            except ImportError:
-                pbar = None
-                print(f"{desc}...")
+            # Undo any Content-Encoding (gzip etc.) like iter_content would
+            response.raw.decode_content = True
             
-            while True:
-                res = (await reader.read()).to_py()
-                value, done = res["value"], res["done"]
-                if done:
-                    break
-                value = value.tobytes()
-                yield value
-                if pbar:
-                    pbar.update(len(value))
+            # Progress is updated once per read() call, so its cost stays amortized over each block
+            total = int(response.headers.get("content-length", 0))
+            with open(path, "wb") as f, tqdm.wrapattr(response.raw, "read", total=total, desc=desc, miniters=1) as raw:
+                shutil.copyfileobj(raw, f, length=chunk_size)
+                
+    except ConnectionError:
+        raise Exception(f"Failed to read dataset at '{url}'.") from None
+
+async def _download_ranges(url: str, path: Path, chunk_size: int, connections: int) -> bool:
+    """
+    Downloads the file at URL 'url' to 'path' with concurrent HTTP range requests, each writing its own slice.
+    :param url: The URL containing the data file to be read
+    :param path: Destination file path.
+    :param chunk_size: The size of each chunk read from a connection (in no. of bytes).
+    :param connections: Number of range requests issued in parallel.
+    :returns: True when the file was downloaded, False if ranges are unsupported or HEAD is refused (nothing is written).
+    :raise Exception: When Exception encountered when reading from URL.
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        return False
+    if not hasattr(os, "pwrite"):
+        return False
+    
+    desc = f"Downloading {Path(urlparse(url).path).name}"
+    # Byte offsets only line up with the file on disk if the server sends it unencoded
+    headers = {"Accept-Encoding": "identity"}
+    # No limit on the whole transfer (large files take a while), only on stalled reads
+    timeout = aiohttp.ClientTimeout(total=None, sock_read=DEFAULT_READ_TIMEOUT)
+    
+    try:
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            async with session.head(url, allow_redirects=True) as response:
+                # Some servers (e.g. presigned URLs) refuse HEAD but serve GET; let the caller stream it
+                if not 200 <= response.status < 300:
+                    return False
+                total = int(response.headers.get("Content-Length", 0))
+                accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+            if not accepts_ranges or total == 0:
+                return False
             
-            if pbar:
-                pbar.close()
+            part_size = -(-total // connections)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                # Preallocate so every range can be written at its final offset
+                os.ftruncate(fd, total)
+                with tqdm(total=total, desc=desc, miniters=1) as pbar:
+                    async def fetch_range(start: int, end: int) -> None:
+                        async with session.get(url, headers={"Range": f"bytes={start}-{end}"}) as response:
+                            if response.status != 206:
+                                raise Exception(
+                                    f"received status code {response.status} for a range request to '{url}'."
+                                )
+                            # The server must send exactly the requested span, or the preallocated
+                            # file would be left with a hole (or a neighbouring range overwritten)
+                            content_range = response.headers.get("Content-Range", "")
+                            if not content_range.startswith(f"bytes {start}-{end}/"):
+                                raise Exception(
+                                    f"received Content-Range '{content_range}' for bytes {start}-{end} from '{url}'."
+                                )
+                            offset = start
+                            async for chunk in response.content.iter_chunked(chunk_size):
+                                if offset + len(chunk) > end + 1:
+                                    raise Exception(f"received more than bytes {start}-{end} from '{url}'.")
+                                os.pwrite(fd, chunk, offset)
+                                offset += len(chunk)
+                                pbar.update(len(chunk))
+                            if offset != end + 1:
+                                raise Exception(
+                                    f"received bytes {start}-{offset - 1} of requested {start}-{end} from '{url}'."
+                                )
+                    
+                    tasks = [
+                        asyncio.ensure_future(fetch_range(start, min(start + part_size, total) - 1))
+                        for start in range(0, total, part_size)
+                    ]
+                    try:
+                        await asyncio.gather(*tasks)
+                    except BaseException:
+                        # Stop the remaining ranges before fd is closed under them
+                        for task in tasks:
+                            task.cancel()
+                        await asyncio.gather(*tasks, return_exceptions=True)
+                        raise
+            finally:
+                os.close(fd)
                 
-        except JsException:
-            raise Exception(f"Failed to read dataset at '{url}'.") from None
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        raise Exception(f"Failed to read dataset at '{url}'.") from None
+    
+    return True
+
+async def _get_chunks(url: str, chunk_size: int) -> Generator[bytes, None, None]:
+    """
+    Generator that yields consecutive chunks of bytes from URL 'url'
+    :param url: The URL containing the data file to be read
+    :param chunk_size: The size of each chunk (in no. of bytes).
+    :returns: Generator yielding chunks of bytes from file at URL until done.
+    :raise InvalidURLException: When URL is invalid.
+    :raise Exception: When Exception encountered when reading from URL.
+    """
+    if not _is_url_valid(url):
+        raise InvalidURLException(url)
+    
+    desc = f"Downloading {Path(urlparse(url).path).name}"
+    
+    if _is_jupyterlite():
+        # JupyterLite environment (browser-based)
+        async for chunk in _get_chunks_js(url, chunk_size):
+            yield chunk
     else:
         # Standard Python environment
         import requests
@@ -167,6 +303,7 @@ async def download(
     path: Optional[str] = None,
     verbose: bool = True,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
+    connections: int = DEFAULT_CONNECTIONS,
 ) -> None:
     """
     Downloads file located at URL to path.
@@ -179,9 +316,18 @@ async def download(
         if path.is_dir():
             path /= filename
     
-    with open(path, "wb") as f:  # Will raise FileNotFoundError if invalid path
-        async for chunk in _get_chunks(url, chunk_size):
-            f.write(chunk)
+    if not _is_url_valid(url):
+        raise InvalidURLException(url)
+    
+    if _is_jupyterlite():
+        with open(path, "wb") as f:  # Will raise FileNotFoundError if invalid path
+            async for chunk in _get_chunks_js(url, chunk_size):
+                f.write(chunk)
+    else:
+        # Parallel range requests when the server supports them, otherwise a single stream.
+        # The blocking copy runs in a worker thread so the event loop stays responsive
+        if not await _download_ranges(url, path, chunk_size, connections):
+            await asyncio.to_thread(_download_requests, url, path, chunk_size)
     
     if verbose:
         print(f"Saved as '{os.path.relpath(path.resolve())}'")
@@ -191,9 +337,10 @@ async def download_dataset(
     path: Optional[str] = None,
     verbose: bool = True,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
+    connections: int = DEFAULT_CONNECTIONS,
 ) -> None:
     """download()"""
-    return await download(url, path, verbose, chunk_size)
+    return await download(url, path, verbose, chunk_size, connections)
 
 async def read(url: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
     """
@@ -13,90 +13,119 @@ attempt to write stale data, triggering conflict detection and retry logic.
 import warnings
 warnings.filterwarnings('ignore')
 import requests
+import hashlib
+import os
+from pathlib import Path
 import time
-from multiprocessing import Process, Manager
+from multiprocessing import Pool, Value
+from multiprocessing.shared_memory import SharedMemory
 from collections import Counter
 import re
 
-# Repository class with atomic operations and version tracking
+# Compiled once at import; sections are matched as lowercase ASCII bytes
+_WORD_RE = re.compile(rb'[a-z]+')
+
+# Repository class: article bytes live in shared memory, version is a shared ctypes int
 class ArticleRepository:
-    def __init__(self, manager):
-        self.data = manager.dict()
-        self.lock = manager.Lock()
-        self.version = manager.Value('i', 0)
+    def __init__(self, text):
+        data = text.encode('ascii', 'ignore').lower()
+        self.size = len(data)
+        self.shm = SharedMemory(create=True, size=max(self.size, 1))
+        self.shm.buf[:self.size] = data
+        self.version = Value('i', 0, lock=True)
+        self.word_counts = Counter()
     
-    # Atomically read data and current version
+    # Read current version straight from the raw ctypes int (aligned int read, no lock taken)
     def read(self):
-        with self.lock:
-            return dict(self.data), self.version.value
+        return self.version.get_obj().value
     
-    # Atomically write only if version matches (detects staleness)
-    def write(self, new_data, expected_version):
-        with self.lock:
-            if self.version.value != expected_version:
+    # Compare-and-bump under the Value's own lock, touching the raw int inside it
+    def write(self, expected_version):
+        with self.version.get_lock():
+            version = self.version.get_obj()
+            if version.value != expected_version:
                 return False
-            self.data.update(new_data)
-            self.version.value += 1
+            version.value += 1
             return True
+    
+    # Release the shared memory block once all processes are done
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
 
-# Fetch Wikipedia article text
+# Reused HTTP connection and on-disk cache so repeat runs skip the network entirely
+_SESSION = requests.Session()
+CACHE_DIR = Path.home() / '.cache' / 'wikipedia_articles'
+
+# Fetch Wikipedia article text (served from CACHE_DIR when present)
 def fetch_wikipedia_article(title="Sinking of the Titanic"):
-    response = requests.get("https://en.wikipedia.org/w/api.php",
+    cache_file = CACHE_DIR / f"{hashlib.sha1(title.encode()).hexdigest()}.txt"
+    if cache_file.exists():
+        return cache_file.read_text(encoding='utf-8')
+    response = _SESSION.get("https://en.wikipedia.org/w/api.php",
         params={'action': 'query', 'format': 'json', 'titles': title,
                 'prop': 'extracts', 'explaintext': True},
         headers={'User-Agent': 'RepositoryPattern/1.0'})
+    response.raise_for_status()
     pages = response.json()['query']['pages']
-    return pages[list(pages.keys())[0]]['extract']
+    text = pages[list(pages.keys())[0]]['extract']
+    # Write under a temporary name and rename into place, so an interrupted run never leaves
+    # a truncated file that the exists() check above would serve from then on
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_text(text, encoding='utf-8')
+        os.replace(tmp_file, cache_file)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+    return text
+
+# Worker initializer: attach to the repository once per process
+def _init_worker(repo):
+    global _repo
+    _repo = repo
 
 # Process reads from repository, maintains own state during work, then writes back
-def analyze_section(repo, process_id, start, length, delay):
-    # Read data snapshot with version
-    data, version = repo.read()
+def analyze_section(process_id, start, length, delay):
+    # Read current version
+    version = _repo.read()
     print(f"Process {process_id}: Read version {version}")
     
-    # Process maintains own state - count words in section
-    section = data['text'][start:start + length]
-    words = re.findall(r'\b[a-z]+\b', section.lower())
-    word_count = Counter(words)
+    # Process maintains own state - count words in a zero-copy view of its section
+    section = _repo.shm.buf[start:start + length]
+    word_count = Counter(_WORD_RE.findall(section))
+    section.release()
     time.sleep(delay)
     
-    # Attempt to write back results with version check
-    data, _ = repo.read()
-    data['word_counts'].update(word_count)
-    
-    if repo.write(data, version):
+    # Attempt to publish results with version check
+    if _repo.write(version):
         print(f"Process {process_id}: Write succeeded")
     else:
-        # Handle conflict - data became stale during work
+        # Handle conflict - repository changed during work
         print(f"Process {process_id}: CONFLICT - retrying")
-        data, _ = repo.read()
-        data['word_counts'].update(word_count)
-        repo.write(data, repo.read()[1])
+        while not _repo.write(_repo.read()):
+            pass
+    return word_count
 
 if __name__ == "__main__":
     # Initialize repository with article data
     text = fetch_wikipedia_article()
-    manager = Manager()
-    repo = ArticleRepository(manager)
-    repo.write({'text': text, 'word_counts': Counter()}, 0)
+    repo = ArticleRepository(text)
     
     print(f"Processing {len(text.split())} words\n")
     
-    # Spawn 4 processes with different work delays (creates staleness)
-    processes = []
-    section_size = len(text) // 4
-    for i, delay in enumerate([0.5, 0.1, 0.3, 0.2]):
-        p = Process(target=analyze_section, 
-                   args=(repo, i+1, i*section_size, section_size, delay))
-        processes.append(p)
-        p.start()
-    
-    # Wait for all processes to complete
-    for p in processes:
-        p.join()
-    
-    # Read final results from repository
-    final_data, final_version = repo.read()
-    print(f"\nFinal version: {final_version}")
-    print(f"Total words: {sum(final_data['word_counts'].values())}")
-    print(f"Top 10: {final_data['word_counts'].most_common(10)}")
\ No newline at end of file
+    # Run 4 processes with different work delays (creates staleness)
+    section_size = repo.size // 4
+    tasks = [(i+1, i*section_size, section_size, delay)
+             for i, delay in enumerate([0.5, 0.1, 0.3, 0.2])]
+    try:
+        with Pool(processes=4, initializer=_init_worker, initargs=(repo,)) as pool:
+            for word_count in pool.starmap(analyze_section, tasks, chunksize=1):
+                repo.word_counts.update(word_count)
+        
+        # Read final results from repository
+        print(f"\nFinal version: {repo.read()}")
+        print(f"Total words: {sum(repo.word_counts.values())}")
+        print(f"Top 10: {[(w.decode(), n) for w, n in repo.word_counts.most_common(10)]}")
+    finally:
+        repo.close()
\ No newline at end of file
@@ -1,5 +1,6 @@
-import os, sys, subprocess, logging, warnings
+import sys, subprocess, logging, warnings
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # --- SILENCE WARNINGS ---
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -19,7 +20,6 @@ bootstrap()
 from dotenv import load_dotenv
 _env_path = Path(__file__).resolve().parent / "api_keys" / ".env"
 load_dotenv(_env_path)
-from google import genai
 from google.genai import types
 
 # Local Package Imports
@@ -35,12 +35,13 @@ from tools import (
     run_linter, 
     write_to_file
 )
+from tools._client import get_client
 
 logger = setup_logger()
 
 class ModularAgent:
     def __init__(self, root_dir, model_id="gemini-2.0-flash"):
-        self.client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+        self.client = get_client()
         self.history = []
         self.root_dir = root_dir
         self.model_id = model_id
@@ -75,6 +76,14 @@ class ModularAgent:
         else:
             return "You are a helpful coding assistant. Use tools to analyze the repo."
 
+    def _execute_tool(self, call):
+        """Runs a single requested tool; returns None for unknown tool names."""
+        tool_func = self.available_tools.get(call.name)
+        if not tool_func:
+            return None
+        print(f"--> [DEBUG] Executing tool: {call.name}")
+        return tool_func(**call.args)
+
     def run(self, prompt):
         """Orchestrates the Discovery, Proposal, and Authorized Execution."""
         # 1. Add user message to history
@@ -117,13 +126,29 @@ class ModularAgent:
                     executed_write = False
                     write_result = ""
 
-                    for part in tool_requests:
+                    # Read-only tools are independent and mostly I/O-bound, so each run of them
+                    # between writes executes concurrently. Writes ask the user for confirmation
+                    # and act as barriers: calls after a write see the file it wrote.
+                    results = {}
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        futures = {}
+                        for i, part in enumerate(tool_requests):
+                            if part.function_call.name == "write_to_file":
+                                for future in as_completed(futures):
+                                    results[futures[future]] = future.result()
+                                futures = {}
+                                results[i] = self._execute_tool(part.function_call)
+                            else:
+                                futures[executor.submit(self._execute_tool, part.function_call)] = i
+                        for future in as_completed(futures):
+                            results[futures[future]] = future.result()
+
+                    # Responses go back in the order the model requested them
+                    for i, part in enumerate(tool_requests):
                         call = part.function_call
-                        tool_func = self.available_tools.get(call.name)
+                        result = results[i]
                         
-                        if tool_func:
-                            print(f"--> [DEBUG] Executing tool: {call.name}")
-                            result = tool_func(**call.args)
+                        if result is not None:
                             result_str = str(result)
                             
                             tool_responses.append(
@@ -0,0 +1,16 @@
+# This file provides a single shared Gemini client for the agent and its tools.
+import os
+import threading
+from google import genai
+
+_client = None
+_lock = threading.Lock()
+
+def get_client() -> genai.Client:
+    """Returns the shared Gemini client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+    return _client
@@ -1,5 +1,4 @@
-import os
-from google import genai
+from ._client import get_client
 import logging
 
 logger = logging.getLogger("CodebaseAgent")
@@ -7,7 +6,7 @@ logger = logging.getLogger("CodebaseAgent")
 def explain_architecture(tree_data: str) -> str:
     """Explains high-level architecture based on provided tree data."""
     print("--> Calling explain_architecture...")
-    client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+    client = get_client()
     prompt = f"Analyze this file tree and describe the overall software architecture pattern used:\n{tree_data}"
     response = client.models.generate_content(model="gemini-2.0-flash", contents=prompt)
     return response.text
\ No newline at end of file
@@ -1,12 +1,21 @@
 import os
+import hashlib
 import logging
 import tempfile
 from pathlib import Path
 
 logger = logging.getLogger("CodebaseAgent")
 
-def write_to_file(filepath: str, content: str) -> str:
-    """Overwrites a file with atomic replacement, deep debugging, and verification."""
+# Block size for writing and for streaming the verification read
+CHUNK_SIZE = 64 * 1024
+
+def write_to_file(filepath: str, content: str, durable: bool = False) -> str:
+    """Overwrites a file with atomic replacement, deep debugging, and verification.
+
+    The temp file + os.replace swap already guarantees readers see either the old or the
+    new file. Set durable=True to also fsync before the swap, so the new contents survive
+    a power loss at the cost of a disk barrier (often 1-20ms) per write.
+    """
     
     # --- UNCLOBBERED FIREWALL ---
     print(f"\n[!] TOOL LEVEL BLOCK: {filepath}")
@@ -32,15 +41,25 @@ def write_to_file(filepath: str, content: str) -> str:
         
         # --- ATOMIC WRITE LOGIC ---
         # 1. Create a temp file in the same directory as the target
-        # 2. Write content and force sync to disk
+        # 2. Write content; sync to disk only if durable
         # 3. Rename/Replace the target file (Triggers IDE File Watcher)
         print(f"[DEBUG 4] Attempting atomic write via temp file...")
         
-        with tempfile.NamedTemporaryFile('w', dir=path.parent, delete=False, encoding='utf-8') as tf:
-            tf.write(content)
-            tf.flush()
-            os.fsync(tf.fileno())
+        data = content.encode("utf-8")
+        # Full read-back verification only runs with debug logging; size is checked always
+        deep_verify = logger.isEnabledFor(logging.DEBUG)
+        write_hash = hashlib.blake2b()
+        with tempfile.NamedTemporaryFile('wb', dir=path.parent, delete=False) as tf:
             temp_path = tf.name
+            view = memoryview(data)
+            for start in range(0, len(data), CHUNK_SIZE):
+                chunk = view[start:start + CHUNK_SIZE]
+                tf.write(chunk)
+                if deep_verify:
+                    write_hash.update(chunk)
+            if durable:
+                tf.flush()
+                os.fsync(tf.fileno())
 
         # Swap the files
         os.replace(temp_path, path)
@@ -49,18 +68,25 @@ def write_to_file(filepath: str, content: str) -> str:
         if path.exists():
             actual_size = path.stat().st_size
             print(f"[DEBUG 5] Write complete. File size on disk: {actual_size} bytes")
+            if actual_size != len(data):
+                return "Error: Write mismatch. Disk size differs from memory data."
             
-            # Read back immediately to verify
-            verification_read = path.read_text(encoding="utf-8")
-            
-            # FINAL PROOF: Read the first line back from the physical disk
-            first_line = verification_read.splitlines()[0] if verification_read else "[EMPTY]"
-            print(f"[DEBUG 6] Actual First Line on Disk: {first_line}")
+            if deep_verify:
+                # Stream the file back and compare digests instead of holding a second copy in memory
+                read_hash = hashlib.blake2b()
+                first_line = None
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                        if first_line is None:
+                            first_line = chunk.decode("utf-8", errors="replace").splitlines()[0]
+                        read_hash.update(chunk)
+                
+                # FINAL PROOF: First line as read back from the physical disk
+                print(f"[DEBUG 6] Actual First Line on Disk: {first_line if first_line is not None else '[EMPTY]'}")
+                if read_hash.digest() != write_hash.digest():
+                    return f"Error: Write mismatch. Disk data differs from memory data."
 
-            if verification_read.strip() == content.strip():
-                return f"Successfully updated {filepath} (Verified)."
-            else:
-                return f"Error: Write mismatch. Disk data differs from memory data."
+            return f"Successfully updated {filepath} (Verified)."
         else:
             return f"Error: File {filepath} disappeared after write attempt."
             
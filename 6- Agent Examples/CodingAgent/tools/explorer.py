@@ -1,9 +1,13 @@
 from pathlib import Path
 import logging
 import os
+from collections import deque
 
 logger = logging.getLogger("CodebaseAgent")
 
+SKIP = frozenset({'.git', '__pycache__', 'node_modules', '.venv', 'venv', '.env', 'dist', 'build'})
+INDENTS = ["|   " * d for d in range(64)]
+
 def get_file_tree(directory: str = ".") -> str:
     """Solely generates a recursive file tree. Defaults to CWD."""
     print(f"--> Calling get_file_tree (directory: {directory})...")
@@ -11,22 +15,29 @@ def get_file_tree(directory: str = ".") -> str:
     
     logger.info(f"Explorer: Mapping {target_path}")
     output = []
-    skip = {'.git', '__pycache__', 'node_modules', '.venv', 'venv', '.env', 'dist', 'build'}
     
-    def walk(path, indent=""):
+    # Explicit stack instead of recursion: ("dir", path) expands a directory,
+    # ("entry", DirEntry) emits a line. Children are pushed in reverse so they pop in sorted order.
+    stack = deque([("dir", str(target_path), 0)])
+    while stack:
+        kind, item, depth = stack.pop()
+        prefix = INDENTS[depth] if depth < len(INDENTS) else "|   " * depth
+        if kind == "entry":
+            if item.is_dir(follow_symlinks=False):
+                output.append(f"{prefix}[DIR] {item.name}")
+                stack.append(("dir", item.path, depth + 1))
+            else:
+                output.append(f"{prefix}|-- {item.name}")
+            continue
         try:
-            for item in sorted(path.iterdir()):
-                if item.name in skip or item.name.startswith("."):
-                    continue
-                
-                if item.is_dir():
-                    output.append(f"{indent}[DIR] {item.name}")
-                    walk(item, indent + "|   ")
-                else:
-                    output.append(f"{indent}|-- {item.name}")
+            # DirEntry caches the type from the directory read, so no extra stat per entry
+            with os.scandir(item) as it:
+                entries = sorted((e for e in it if e.name not in SKIP and not e.name.startswith(".")),
+                                 key=lambda e: e.name, reverse=True)
         except Exception as e:
-            output.append(f"{indent}[Error accessing {path.name}: {e}]")
+            output.append(f"{prefix}[Error accessing {os.path.basename(item)}: {e}]")
+            continue
+        stack.extend(("entry", entry, depth) for entry in entries)
             
-    walk(target_path)
     tree = "\n".join(output)
     return tree if tree else "The directory appears to be empty or inaccessible."
\ No newline at end of file
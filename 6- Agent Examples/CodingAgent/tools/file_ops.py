@@ -1,24 +1,37 @@
-from pathlib import Path
 import logging
+import os
+from collections import deque
 
 logger = logging.getLogger("CodebaseAgent")
 
+SKIP = frozenset({".git", "__pycache__", "node_modules", ".venv", "venv", ".env", "dist", "build"})
+INDENTS = ["|   " * d for d in range(64)]
+MAX_CHARS = 30000
+
 def list_files(directory: str = ".") -> str:
     """Returns a full file tree and prints it to terminal immediately."""
     logger.info(f"Tool Action: Scanning {directory}")
     output = []
-    skip = {".git", "__pycache__", "node_modules", ".venv", "venv", ".env", "dist", "build"}
     
-    def walk(path, indent=""):
+    # Iterative depth-first walk; children are pushed in reverse so they pop in sorted order
+    stack = deque([("dir", directory, 0)])
+    while stack:
+        kind, item, depth = stack.pop()
+        prefix = INDENTS[depth] if depth < len(INDENTS) else "|   " * depth
+        if kind == "entry":
+            is_dir = item.is_dir(follow_symlinks=False)
+            output.append(f"{prefix}[DIR] {item.name}" if is_dir else f"{prefix}|-- {item.name}")
+            if is_dir:
+                stack.append(("dir", item.path, depth + 1))
+            continue
         try:
-            for item in sorted(Path(path).iterdir()):
-                if item.name in skip or item.name.startswith("."): continue
-                line = f"{indent}|-- {item.name}" if item.is_file() else f"{indent}[DIR] {item.name}"
-                output.append(line)
-                if item.is_dir():
-                    walk(item, indent + "|   ")
+            with os.scandir(item) as it:
+                entries = sorted((e for e in it if e.name not in SKIP and not e.name.startswith(".")),
+                                 key=lambda e: e.name, reverse=True)
         except Exception as e:
-            output.append(f"{indent}[Error: {e}]")
+            output.append(f"{prefix}[Error: {e}]")
+            continue
+        stack.extend(("entry", entry, depth) for entry in entries)
             
     tree_text = "\n".join(output) if output else "Directory is empty."
     
@@ -33,7 +46,9 @@ def read_file(filepath: str) -> str:
     """Reads content from a file (limit 30k chars)."""
     logger.info(f"Tool Action: Reading {filepath}")
     try:
-        content = Path(filepath).read_text(errors="ignore")
-        return content[:30000] if len(content) > 30000 else content
+        # Read only as many bytes as MAX_CHARS can need (UTF-8 is at most 4 bytes per char)
+        with open(filepath, "rb") as f:
+            raw = f.read(MAX_CHARS * 4)
+        return raw.decode("utf-8", errors="ignore")[:MAX_CHARS]
     except Exception as e:
         return f"Error: {e}"
\ No newline at end of file
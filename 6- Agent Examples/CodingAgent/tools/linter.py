@@ -1,12 +1,34 @@
 # This file provides linting functionality for various file types.
 import subprocess
 import os
-import sys  # <--- Added this import
 import logging
+import threading
 from pathlib import Path
+from flake8.api import legacy as flake8_api
+from flake8.formatting.default import Default
 
 logger = logging.getLogger("CodebaseAgent")
 
+# Lines reported by the in-process flake8 run; guarded by _FLAKE8_LOCK
+_FLAKE8_OUTPUT = []
+_FLAKE8_LOCK = threading.Lock()
+
+class _CollectingFormatter(Default):
+    """Buffers flake8 report lines instead of printing them to stdout."""
+    def _write(self, output: str) -> None:
+        _FLAKE8_OUTPUT.append(output)
+
+# Built once at import so each lint skips interpreter startup and plugin loading
+_STYLE = flake8_api.get_style_guide(select=["E", "F", "W", "C"])
+_STYLE.init_report(_CollectingFormatter)
+
+def _run_flake8(path: Path) -> str:
+    """Lints a Python file in-process and returns the report text."""
+    with _FLAKE8_LOCK:
+        _FLAKE8_OUTPUT.clear()
+        _STYLE.check_files([str(path)])
+        return "\n".join(_FLAKE8_OUTPUT)
+
 def run_linter(filepath: str) -> str:
     """Runs a language-specific linter on the given file."""
     print(f"--> Calling run_linter (path: {filepath})...")
@@ -17,22 +39,26 @@ def run_linter(filepath: str) -> str:
     ext = path.suffix.lower()
     try:
         if ext == ".py":
-            # UPDATED: Use sys.executable -m to ensure we use the local flake8 installation
-            cmd = [sys.executable, "-m", "flake8", "--select=E,F,W,C", str(path)]
+            output = _run_flake8(path)
+            if output:
+                return f"Linter Output for {filepath}:\n{output}"
+            return f"No syntax or linting issues found in {filepath}."
         elif ext in [".js", ".ts", ".tsx"]:
             cmd = ["npx", "eslint", str(path), "--no-error-on-unmatched-pattern"]
         else:
             return f"Linter support for {ext} is not yet implemented."
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Explicit UTF-8 decoding avoids locale codec lookup on every run
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding="utf-8")
+        stdout, stderr = proc.communicate()
         
-        # Flake8 returns exit code 1 if issues are found, result.stdout will contain them
-        if result.stdout:
-            return f"Linter Output for {filepath}:\n{result.stdout}"
+        # ESLint returns exit code 1 if issues are found, stdout will contain them
+        if stdout:
+            return f"Linter Output for {filepath}:\n{stdout}"
         
         # If there is no stdout but an error in stderr, report that
-        if result.stderr:
-            return f"Linter Error:\n{result.stderr}"
+        if stderr:
+            return f"Linter Error:\n{stderr}"
         
         return f"No syntax or linting issues found in {filepath}."
     except Exception as e:
@@ -1,15 +1,18 @@
 # This file provides functionality for reading raw file content.
-from pathlib import Path
 import logging
 
 logger = logging.getLogger("CodebaseAgent")
 
+MAX_CHARS = 30000
+
 def read_raw_file(filepath: str) -> str:
     """Reads the exact raw content of a file."""
     print(f"--> Calling read_raw_file (path: {filepath})...")
     logger.info(f"Reader: Loading {filepath}")
     try:
-        content = Path(filepath).read_text(errors="ignore")
-        return content[:30000] if len(content) > 30000 else content
+        # Read only as many bytes as MAX_CHARS can need (UTF-8 is at most 4 bytes per char)
+        with open(filepath, "rb") as f:
+            raw = f.read(MAX_CHARS * 4)
+        return raw.decode("utf-8", errors="ignore")[:MAX_CHARS]
     except Exception as e:
         return f"Error: {e}"
\ No newline at end of file
@@ -1,5 +1,4 @@
-import os
-from google import genai
+from ._client import get_client
 from google.genai import types
 import logging
 
@@ -10,9 +9,9 @@ def web_research(query: str) -> str:
     print(f"--> Calling web_research (query: {query})...")
     logger.info(f"Search: Researching '{query}'...")
     
-    temp_client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+    client = get_client()
     try:
-        response = temp_client.models.generate_content(
+        response = client.models.generate_content(
             model="gemini-2.0-flash",
             contents=f"Research the following technical topic and provide a detailed summary: {query}",
             config=types.GenerateContentConfig(
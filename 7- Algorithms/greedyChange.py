@@ -4,45 +4,49 @@ This portfolio example demonstrates practical I/O handling and a classic greedy
 Other developers can use this as a reference for implementing classic greedy algorithms or for similar situations where an optimal local choice leads to a global optimum—such as resource allocation or scheduling challenges.
 """
 
+from decimal import Decimal, DecimalException, ROUND_HALF_UP
+
+# Denominations the algorithm will use for making change, as (integer cents, singular, plural) tuples, largest first.
+# Working in whole cents keeps every step exact, so no per-denomination rounding is needed.
+# Names are spelled out in both forms so printing never has to derive a plural.
+DENOMINATIONS = [
+    (10000, "$100 bill", "$100 bills"),
+    (5000, "$50 bill", "$50 bills"),
+    (2000, "$20 bill", "$20 bills"),
+    (1000, "$10 bill", "$10 bills"),
+    (500, "$5 bill", "$5 bills"),
+    (100, "$1 bill", "$1 bills"),
+    (25, "quarter", "quarters"),
+    (10, "dime", "dimes"),
+    (5, "nickel", "nickels"),
+    (1, "penny", "pennies")
+]
+
 # The locally optimal greedy choice: always take as many of the largest denomination as possible at each step.
 def change(money):
-    # List of denominations the algorithm will use for making change, as (float, string) pairs.
-    denominations = [
-        (100.00, "$100 bill"),
-        (50.00, "$50 bill"),
-        (20.00, "$20 bill"),
-        (10.00, "$10 bill"),
-        (5.00, "$5 bill"),
-        (1.00, "$1 bill"),
-        (0.25, "quarter"),
-        (0.10, "dime"),
-        (0.05, "nickel"),
-        (0.01, "penny")
-    ]
     change_counter = 0
-    # amount_left tracks how much remains where change needs to be issued
-    amount_left = round(money, 2)  # round to the nearest cent to match real-world currency floats
-    denomination_counts = []
-    for coin, name in denominations:
-        count = int(amount_left // coin)
+    # amount_left tracks how many cents remain; dollars are converted to whole cents once, up front.
+    # Going through Decimal (str() gives a float's shortest repr) avoids binary rounding, so e.g. 1.005 is 101 cents.
+    amount_left = int((Decimal(str(money)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+    # Only integer divmod from here on, printing each denomination's line as it is counted
+    for cents, singular, plural in DENOMINATIONS:
+        count, amount_left = divmod(amount_left, cents)
         change_counter += count
-        if count > 0:
-            denomination_counts.append((name, count))
-        amount_left = round(amount_left - count * coin, 2)
-    # Printing denomination breakdown
-    for name, count in denomination_counts:
-        unit = name if count == 1 else (name + "s" if not name.endswith("y") else name[:-1] + "ies")
-        print(f"{count} {unit}")
+        if count:
+            print(f"{count} {plural if count != 1 else singular}")
     return change_counter
 
 # Handles user input/output : prompts user, parses input, prints results or error.
 if __name__ == '__main__':
     try:
         user_input = input("Enter an amount in dollars and cents (e.g., 18.36): ")
-        m = float(user_input)
+        # Parse as an exact decimal rather than a binary float
+        m = Decimal(user_input.strip())
+        if not m.is_finite():
+            raise ValueError(user_input)
         if m < 0:
             print("Amount cannot be negative.")
         else:
             print("Minimum number of coins and bills needed:", change(m))
-    except ValueError:
+    except (ValueError, DecimalException):
         print("Invalid input. Please enter a valid numeric amount.")